@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
 import { FileText, Code, Brain, Shield, BookOpen } from 'lucide-react';
 
 const AIEthicsAssignment = () => {
@@ -367,56 +367,184 @@ const Part2Cases = () => (
   </div>
 );
 
-const Part3Audit = () => (
-  <div className="space-y-6">
-    <div className="bg-indigo-50 border-l-4 border-indigo-600 p-4">
-      <h3 className="text-lg font-bold text-indigo-900 mb-2">COMPAS Fairness Audit</h3>
-      <p className="text-gray-700">
-        This section provides the complete code for auditing the COMPAS Recidivism Dataset using AI Fairness 360.
-        The code analyzes racial bias in risk scores and generates visualizations.
-      </p>
-    </div>
+// Local results API started with `python compas_audit.py2 --serve`
+const AUDIT_API = 'http://127.0.0.1:8765/api';
+
+const METRIC_NAMES = {
+  disparate_impact: 'Disparate Impact',
+  statistical_parity_difference: 'Statistical Parity Difference',
+  equal_opportunity_difference: 'Equal Opportunity Difference',
+  average_odds_difference: 'Average Odds Difference',
+  theil_index: 'Theil Index',
+};
+
+const pct = (value) => (value == null ? '-' : `${(value * 100).toFixed(1)}%`);
+
+const fetchJson = (path) =>
+  fetch(`${AUDIT_API}${path}`).then((response) => {
+    if (!response.ok) throw new Error(response.statusText);
+    return response.json();
+  });
+
+const Part3Audit = () => {
+  const [threshold, setThreshold] = useState(5);
+  const [results, setResults] = useState(null);
+  const [sweep, setSweep] = useState(null);
+  const [offline, setOffline] = useState(false);
 
-    <div className="bg-white border rounded-lg p-5 shadow">
-      <h4 className="font-bold text-gray-800 mb-3">Code Implementation Guide</h4>
-      <div className="bg-gray-50 p-4 rounded font-mono text-sm">
-        <p className="text-gray-600 mb-2"># Download the Python code from the artifact</p>
-        <p className="text-gray-600"># Or copy the code provided separately</p>
+  useEffect(() => {
+    fetchJson('/thresholds').then(setSweep).catch(() => setOffline(true));
+  }, []);
+
+  useEffect(() => {
+    fetchJson(`/metrics?threshold=${threshold}`)
+      .then((data) => {
+        setResults(data);
+        setOffline(false);
+      })
+      .catch(() => setOffline(true));
+  }, [threshold]);
+
+  return (
+    <div className="space-y-6">
+      <div className="bg-indigo-50 border-l-4 border-indigo-600 p-4">
+        <h3 className="text-lg font-bold text-indigo-900 mb-2">COMPAS Fairness Audit</h3>
+        <p className="text-gray-700">
+          Live results from auditing the COMPAS Recidivism Dataset with AI Fairness 360 metrics: error rates and
+          fairness metrics by race, how they change with the high-risk threshold, and the audit visualizations.
+        </p>
       </div>
-    </div>
 
-    <div className="bg-white border rounded-lg p-5 shadow">
-      <h4 className="font-bold text-gray-800 mb-3">Key Analysis Components</h4>
-      <div className="space-y-3 text-gray-700">
-        <div className="border-l-4 border-blue-500 pl-4">
-          <p className="font-semibold">1. Data Loading & Preprocessing</p>
-          <p>Load COMPAS dataset and prepare for fairness analysis</p>
-        </div>
-        <div className="border-l-4 border-green-500 pl-4">
-          <p className="font-semibold">2. Bias Metrics Calculation</p>
-          <p>Compute disparate impact, statistical parity difference, equal opportunity difference</p>
-        </div>
-        <div className="border-l-4 border-purple-500 pl-4">
-          <p className="font-semibold">3. Visualizations</p>
-          <p>Generate charts showing false positive rates, risk score distributions by race</p>
+      {offline ? (
+        <div className="bg-white border rounded-lg p-5 shadow">
+          <h4 className="font-bold text-gray-800 mb-3">Start the Results Server</h4>
+          <div className="bg-gray-50 p-4 rounded font-mono text-sm">
+            <p className="text-gray-600 mb-2"># Serve the audit results locally, then reload this tab</p>
+            <p className="text-gray-800">python compas_audit.py2 --serve</p>
+          </div>
         </div>
-        <div className="border-l-4 border-red-500 pl-4">
-          <p className="font-semibold">4. Mitigation Strategies</p>
-          <p>Apply reweighing and prejudice remover techniques</p>
+      ) : (
+        <>
+          <div className="bg-white border rounded-lg p-5 shadow">
+            <div className="flex items-center justify-between mb-3">
+              <h4 className="font-bold text-gray-800">Error Rates by Race</h4>
+              <label className="flex items-center gap-3 text-sm text-gray-600">
+                High-risk threshold: decile score &ge; {threshold}
+                <input
+                  type="range"
+                  min="1"
+                  max="10"
+                  value={threshold}
+                  onChange={(e) => setThreshold(Number(e.target.value))}
+                />
+              </label>
+            </div>
+            {results && (
+              <div className="grid md:grid-cols-2 gap-4">
+                <table className="w-full text-sm text-gray-700">
+                  <thead>
+                    <tr className="border-b text-left">
+                      <th className="py-2">Group</th>
+                      <th>FPR</th>
+                      <th>FNR</th>
+                      <th>High risk</th>
+                      <th>Reoffended</th>
+                    </tr>
+                  </thead>
+                  <tbody>
+                    {Object.entries(results.groups).map(([group, rates]) => (
+                      <tr key={group} className="border-b">
+                        <td className="py-2 font-semibold">{group}</td>
+                        <td>{pct(rates.FPR)}</td>
+                        <td>{pct(rates.FNR)}</td>
+                        <td>{pct(rates.high_risk_rate)}</td>
+                        <td>{pct(rates.recid_rate)}</td>
+                      </tr>
+                    ))}
+                  </tbody>
+                </table>
+                <div className="space-y-1 text-sm text-gray-700">
+                  {Object.entries(METRIC_NAMES).map(([key, name]) => (
+                    <p key={key}>
+                      <span className="font-semibold">{name}:</span>{' '}
+                      {results.fairness_metrics[key] == null ? '-' : results.fairness_metrics[key].toFixed(3)}
+                    </p>
+                  ))}
+                </div>
+              </div>
+            )}
+          </div>
+
+          {sweep && (
+            <div className="bg-white border rounded-lg p-5 shadow overflow-x-auto">
+              <h4 className="font-bold text-gray-800 mb-3">Threshold Sweep (FPR / FNR)</h4>
+              <table className="w-full text-sm text-gray-700">
+                <thead>
+                  <tr className="border-b text-left">
+                    <th className="py-2">Threshold</th>
+                    {sweep.groups.map((group) => (
+                      <th key={group}>{group}</th>
+                    ))}
+                  </tr>
+                </thead>
+                <tbody>
+                  {sweep.thresholds.map((t, i) => t != null && (
+                    <tr key={t} className={`border-b ${t === threshold ? 'bg-indigo-50' : ''}`}>
+                      <td className="py-1">&ge; {t}</td>
+                      {sweep.groups.map((group, g) => (
+                        <td key={group}>{pct(sweep.FPR[g][i])} / {pct(sweep.FNR[g][i])}</td>
+                      ))}
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+          )}
+
+          <div className="bg-white border rounded-lg p-5 shadow">
+            <h4 className="font-bold text-gray-800 mb-3">Visualizations</h4>
+            <img
+              src={`${AUDIT_API}/plot.png?threshold=${threshold}&dpi=100`}
+              alt="COMPAS fairness audit visualizations"
+              className="w-full"
+            />
+          </div>
+        </>
+      )}
+
+      <div className="bg-white border rounded-lg p-5 shadow">
+        <h4 className="font-bold text-gray-800 mb-3">Key Analysis Components</h4>
+        <div className="space-y-3 text-gray-700">
+          <div className="border-l-4 border-blue-500 pl-4">
+            <p className="font-semibold">1. Data Loading & Preprocessing</p>
+            <p>Load COMPAS dataset and prepare for fairness analysis</p>
+          </div>
+          <div className="border-l-4 border-green-500 pl-4">
+            <p className="font-semibold">2. Bias Metrics Calculation</p>
+            <p>Compute disparate impact, statistical parity difference, equal opportunity difference</p>
+          </div>
+          <div className="border-l-4 border-purple-500 pl-4">
+            <p className="font-semibold">3. Visualizations</p>
+            <p>Generate charts showing false positive rates, risk score distributions by race</p>
+          </div>
+          <div className="border-l-4 border-red-500 pl-4">
+            <p className="font-semibold">4. Mitigation Strategies</p>
+            <p>Apply reweighing and prejudice remover techniques</p>
+          </div>
         </div>
       </div>
-    </div>
 
-    <div className="bg-yellow-50 border-l-4 border-yellow-500 p-4">
-      <h4 className="font-bold text-yellow-900 mb-2">Expected Findings</h4>
-      <p className="text-gray-700">
-        The COMPAS audit typically reveals significant racial disparities with Black defendants receiving higher 
-        risk scores and experiencing higher false positive rates compared to White defendants, even when controlling 
-        for actual recidivism rates.
-      </p>
+      <div className="bg-yellow-50 border-l-4 border-yellow-500 p-4">
+        <h4 className="font-bold text-yellow-900 mb-2">Expected Findings</h4>
+        <p className="text-gray-700">
+          The COMPAS audit typically reveals significant racial disparities with Black defendants receiving higher 
+          risk scores and experiencing higher false positive rates compared to White defendants, even when controlling 
+          for actual recidivism rates.
+        </p>
+      </div>
     </div>
-  </div>
-);
+  );
+};
 
 const Part4Reflection = () => (
   <div className="space-y-6">